@@ -1,8 +1,23 @@
 from django_filters import FilterSet, CharFilter
+from django_filters.rest_framework import DjangoFilterBackend
 
 from reviews.models import Title
 
 
+class LazyDjangoFilterBackend(DjangoFilterBackend):
+    """
+    DjangoFilterBackend, пропускающий запросы без query-параметров.
+
+    Инстанцирование filterset-формы стоит заметных накладных расходов
+    на каждый запрос; для самого частого случая — просмотр списка без
+    фильтров — backend возвращает queryset как есть.
+    """
+    def filter_queryset(self, request, queryset, view):
+        if not request.query_params:
+            return queryset
+        return super().filter_queryset(request, queryset, view)
+
+
 class TitleFilter(FilterSet):
     """
     Фильтр для модели Title.
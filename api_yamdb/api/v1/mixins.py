@@ -1,9 +1,33 @@
+from copy import deepcopy
+
 from rest_framework.mixins import (
     CreateModelMixin, ListModelMixin, DestroyModelMixin
 )
+from rest_framework.response import Response
 from rest_framework.viewsets import GenericViewSet
 
 
+class CachedFieldsSerializerMixin:
+    """
+    Миксин, кэширующий результат get_fields() на уровне класса
+    сериализатора.
+
+    ModelSerializer при каждом инстанцировании заново интроспектирует
+    модель и пересобирает поля. Карта полей класса неизменна между
+    запросами, поэтому она строится один раз, а наружу отдаются копии
+    полей (deepcopy поля в DRF дешёвый — пересоздание по сохранённым
+    аргументам).
+    """
+
+    def get_fields(self):
+        cls = type(self)
+        fields = cls.__dict__.get('_fields_cache')
+        if fields is None:
+            fields = super().get_fields()
+            cls._fields_cache = fields
+        return {name: deepcopy(field) for name, field in fields.items()}
+
+
 class CreateListDestroyModelMixin(CreateModelMixin, ListModelMixin,
                                   DestroyModelMixin, GenericViewSet):
     """
@@ -29,4 +53,19 @@ class CreateListDestroyModelMixin(CreateModelMixin, ListModelMixin,
     - list (GET): Получение списка всех объектов.
     - destroy (DELETE): Удаление объекта по идентификатору (lookup_field).
     """
-    pass
+
+    def list(self, request, *args, **kwargs):
+        """
+        Возвращает список объектов без инстанцирования сериализатора
+        для каждого объекта.
+
+        Плоские словари строятся прямо в запросе через .values() по полям
+        сериализатора — это заметно быстрее, чем to_representation
+        ModelSerializer для каждой записи на больших списках.
+        """
+        queryset = self.filter_queryset(self.get_queryset()).values(
+            *self.get_serializer().fields)
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(page)
+        return Response(list(queryset))
@@ -0,0 +1,12 @@
+from rest_framework.pagination import LimitOffsetPagination
+
+
+class CappedLimitOffsetPagination(LimitOffsetPagination):
+    """
+    Пагинация LimitOffsetPagination с верхней границей limit.
+
+    Без max_limit клиент может запросить ?limit=100000 и заставить
+    сервер сериализовать всю таблицу за один запрос. Граница держит
+    худший случай по памяти и времени ответа постоянным.
+    """
+    max_limit = 100
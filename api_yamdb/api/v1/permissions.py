@@ -1,6 +1,9 @@
 from rest_framework import permissions
 
 
+SAFE_METHODS = frozenset(permissions.SAFE_METHODS)
+
+
 class IsAdminOrReadOnly(permissions.BasePermission):
     """
     Разрешает доступ на чтение всем пользователям,
@@ -15,8 +18,8 @@ class IsAdminOrReadOnly(permissions.BasePermission):
     но изменяться только администраторами.
     """
     def has_permission(self, request, view):
-        return (request.method in permissions.SAFE_METHODS
-                or request.user.is_authenticated and request.user.is_admin())
+        return (request.method in SAFE_METHODS
+                or request.user.is_authenticated and request.user.is_admin)
 
 
 class ContentManagePermission(permissions.IsAuthenticatedOrReadOnly):
@@ -29,11 +32,11 @@ class ContentManagePermission(permissions.IsAuthenticatedOrReadOnly):
     message = 'Недостаточно прав.'
 
     def has_object_permission(self, request, view, obj):
-        return (request.method in permissions.SAFE_METHODS
+        return (request.method in SAFE_METHODS
                 or request.user.is_authenticated
-                and (obj.author == request.user
-                     or request.user.is_moderator()
-                     or request.user.is_admin()))
+                and (obj.author_id == request.user.id
+                     or request.user.is_moderator
+                     or request.user.is_admin))
 
 
 class IsAdminPermission(permissions.BasePermission):
@@ -42,7 +45,7 @@ class IsAdminPermission(permissions.BasePermission):
     со статусом admin.
     """
     def has_permission(self, request, view):
-        return request.user.is_authenticated and request.user.is_admin()
+        return request.user.is_authenticated and request.user.is_admin
 
 
 class IsUserPermissions(permissions.BasePermission):
@@ -1,13 +1,20 @@
+from collections.abc import Hashable
+
 from django.contrib.auth import get_user_model
-from django.contrib.auth.validators import UnicodeUsernameValidator
 from django.core.exceptions import ValidationError
+from django.db.models import Q
+from django.utils.encoding import smart_str
 from rest_framework import serializers
+from rest_framework.relations import MANY_RELATION_KWARGS
 
-from api_yamdb.settings import MAX_EMAIL_LENGTH
+from api_yamdb.settings import (
+    MAX_EMAIL_LENGTH, REVIEW_MAX_SCORE, REVIEW_MIN_SCORE)
 from reviews.models import (
     Category, Comment, Genre, Review, Title)
 from users.models import MAX_LENGTH_USERNAME
-from users.validators import validate_username
+from users.validators import username_validator, validate_username
+
+from .mixins import CachedFieldsSerializerMixin
 
 
 User = get_user_model()
@@ -16,10 +23,60 @@ User = get_user_model()
 ERROR_USERNAME = 'Пользователь с таким username уже существует.'
 ERROR_EMAIL = 'Пользователь с таким email уже существует.'
 MAX_LENGTH_CODE = 100
-RATING_VALUES = [(i, str(i)) for i in range(1, 11)]
 
 
-class CategorySerializer(serializers.ModelSerializer):
+class BulkManyRelatedField(serializers.ManyRelatedField):
+    """
+    ManyRelatedField, разрешающий все слаги одним запросом.
+
+    Стандартная реализация вызывает to_internal_value дочернего поля
+    для каждого элемента списка, что даёт по одному запросу на слаг.
+    Здесь объекты выбираются одним filter(slug__in=...).
+    """
+    def to_internal_value(self, data):
+        if isinstance(data, str) or not hasattr(data, '__iter__'):
+            self.fail('not_a_list', input_type=type(data).__name__)
+        if not self.allow_empty and len(data) == 0:
+            self.fail('empty')
+        for slug in data:
+            if not isinstance(slug, Hashable):
+                self.child_relation.fail('invalid')
+        slug_field = self.child_relation.slug_field
+        try:
+            found = {
+                getattr(instance, slug_field): instance
+                for instance in self.child_relation.get_queryset().filter(
+                    **{f'{slug_field}__in': data})
+            }
+        except (TypeError, ValueError):
+            self.child_relation.fail('invalid')
+        result = []
+        for slug in data:
+            if slug not in found:
+                self.child_relation.fail(
+                    'does_not_exist',
+                    slug_name=slug_field,
+                    value=smart_str(slug),
+                )
+            result.append(found[slug])
+        return result
+
+
+class BulkSlugRelatedField(serializers.SlugRelatedField):
+    """
+    SlugRelatedField, использующий BulkManyRelatedField при many=True.
+    """
+    @classmethod
+    def many_init(cls, *args, **kwargs):
+        list_kwargs = {'child_relation': cls(*args, **kwargs)}
+        for key in kwargs:
+            if key in MANY_RELATION_KWARGS:
+                list_kwargs[key] = kwargs[key]
+        return BulkManyRelatedField(**list_kwargs)
+
+
+class CategorySerializer(CachedFieldsSerializerMixin,
+                         serializers.ModelSerializer):
     """
     Сериализатор для модели Category.
 
@@ -30,7 +87,8 @@ class CategorySerializer(serializers.ModelSerializer):
         exclude = ('id',)
 
 
-class GenreSerializer(serializers.ModelSerializer):
+class GenreSerializer(CachedFieldsSerializerMixin,
+                      serializers.ModelSerializer):
     """
     Сериализатор для модели Genre.
 
@@ -41,7 +99,8 @@ class GenreSerializer(serializers.ModelSerializer):
         exclude = ('id', )
 
 
-class TitleReadSerializer(serializers.ModelSerializer):
+class TitleReadSerializer(CachedFieldsSerializerMixin,
+                          serializers.ModelSerializer):
     """
     Сериализатор для чтения данных произведения (Title).
 
@@ -57,13 +116,14 @@ class TitleReadSerializer(serializers.ModelSerializer):
                   'genre', 'category', 'rating')
 
 
-class TitleWriteSerializer(serializers.ModelSerializer):
+class TitleWriteSerializer(CachedFieldsSerializerMixin,
+                           serializers.ModelSerializer):
     """
     Сериализатор для записи данных произведения (Title).
 
     Используется для создания и обновления информации о произведении.
     """
-    genre = serializers.SlugRelatedField(
+    genre = BulkSlugRelatedField(
         slug_field='slug',
         queryset=Genre.objects.all(),
         many=True,
@@ -83,7 +143,7 @@ class TitleWriteSerializer(serializers.ModelSerializer):
     def to_representation(self, title):
         """Определяет, какой сериализатор будет использоваться для чтения."""
 
-        return TitleReadSerializer(title).data
+        return TitleReadSerializer(title, context=self.context).data
 
 
 class SignUpSerializer(serializers.Serializer):
@@ -93,7 +153,7 @@ class SignUpSerializer(serializers.Serializer):
     """
     username = serializers.CharField(
         max_length=MAX_LENGTH_USERNAME,
-        validators=[UnicodeUsernameValidator(), validate_username])
+        validators=[username_validator, validate_username])
     email = serializers.EmailField(max_length=MAX_EMAIL_LENGTH)
 
     def validate(self, data):
@@ -104,13 +164,15 @@ class SignUpSerializer(serializers.Serializer):
         """
         email = data.get('email')
         username = data.get('username')
-        email_user = User.objects.filter(email=email).first()
-        username_user = User.objects.filter(username=username).first()
-        if email_user != username_user:
+        matches = list(User.objects.filter(
+            Q(email=email) | Q(username=username)
+        ).values_list('email', 'username'))
+        if matches and (email, username) not in matches:
             error_msg = {}
-            if email_user is not None:
+            if any(found_email == email for found_email, _ in matches):
                 error_msg['email'] = ERROR_EMAIL
-            if username_user is not None:
+            if any(found_username == username
+                   for _, found_username in matches):
                 error_msg['username'] = ERROR_USERNAME
             raise ValidationError(error_msg)
         return data
@@ -122,11 +184,12 @@ class TokenObtainSerializer(serializers.Serializer):
     """
     username = serializers.CharField(
         max_length=MAX_LENGTH_USERNAME,
-        validators=[UnicodeUsernameValidator(), validate_username])
+        validators=[username_validator, validate_username])
     confirmation_code = serializers.CharField(max_length=MAX_LENGTH_CODE)
 
 
-class UserSerializer(serializers.ModelSerializer):
+class UserSerializer(CachedFieldsSerializerMixin,
+                     serializers.ModelSerializer):
     """
     Сериализатор для выполнения CRUD операций с моделью CustomUser
     """
@@ -136,19 +199,19 @@ class UserSerializer(serializers.ModelSerializer):
             'username', 'email', 'first_name', 'last_name', 'bio', 'role')
 
 
-class MeSerializer(serializers.ModelSerializer):
+class MeSerializer(UserSerializer):
     """
     Сериализатор для выполнения операций получения экземпляра
     и внесения изменений в собственный профиль.
+
+    Отличается от UserSerializer только запретом на смену роли.
     """
-    class Meta:
-        model = User
-        fields = (
-            'username', 'email', 'first_name', 'last_name', 'bio', 'role')
+    class Meta(UserSerializer.Meta):
         read_only_fields = ('role',)
 
 
-class ReviewSerializer(serializers.ModelSerializer):
+class ReviewSerializer(CachedFieldsSerializerMixin,
+                       serializers.ModelSerializer):
     """
     Сериализатор для модели Review.
     """
@@ -156,7 +219,8 @@ class ReviewSerializer(serializers.ModelSerializer):
         read_only=True,
         slug_field='username'
     )
-    score = serializers.ChoiceField(choices=RATING_VALUES)
+    score = serializers.IntegerField(
+        min_value=REVIEW_MIN_SCORE, max_value=REVIEW_MAX_SCORE)
 
     class Meta:
         model = Review
@@ -164,18 +228,19 @@ class ReviewSerializer(serializers.ModelSerializer):
         read_only_fields = ('title',)
 
     def validate(self, attrs):
-        request = self.context['view'].request
-        author = request.user
+        view = self.context['view']
+        request = view.request
         if request.method == 'POST':
             if Review.objects.filter(
-                author=author,
-                title__id=self.context['view'].kwargs.get('title_id')
+                author_id=request.user.id,
+                title_id=view.kwargs.get('title_id')
             ).exists():
                 raise ValidationError('Такой отзыв уже есть.')
         return super().validate(attrs)
 
 
-class CommentSerializer(serializers.ModelSerializer):
+class CommentSerializer(CachedFieldsSerializerMixin,
+                        serializers.ModelSerializer):
     """
     Сериализатор для модели Comment.
     """
@@ -21,16 +21,33 @@ v1_router.register('titles', TitleViewSet, basename='titles')
 v1_router.register('genres', GenreViewSet, basename='genres')
 v1_router.register('categories', CategoryViewSet, basename='categories')
 v1_router.register('users', UserAdminViewSet)
-v1_router.register(
-    r'titles/(?P<title_id>\d+)/reviews',
-    ReviewViewSet,
-    basename='reviews')
-v1_router.register(
-    r'titles/(?P<title_id>\d+)/reviews/(?P<review_id>\d+)/comments',
-    CommentViewSet,
-    basename='comments')
+
+review_list = ReviewViewSet.as_view(
+    {'get': 'list', 'post': 'create'})
+review_detail = ReviewViewSet.as_view(
+    {'get': 'retrieve', 'patch': 'partial_update', 'delete': 'destroy'})
+comment_list = CommentViewSet.as_view(
+    {'get': 'list', 'post': 'create'})
+comment_detail = CommentViewSet.as_view(
+    {'get': 'retrieve', 'patch': 'partial_update', 'delete': 'destroy'})
 
 urlpatterns = [
+    path(
+        'titles/<int:title_id>/reviews/',
+        review_list,
+        name='reviews-list'),
+    path(
+        'titles/<int:title_id>/reviews/<int:pk>/',
+        review_detail,
+        name='reviews-detail'),
+    path(
+        'titles/<int:title_id>/reviews/<int:review_id>/comments/',
+        comment_list,
+        name='comments-list'),
+    path(
+        'titles/<int:title_id>/reviews/<int:review_id>/comments/<int:pk>/',
+        comment_detail,
+        name='comments-detail'),
     path('', include(v1_router.urls)),
     path(f'{AUTH}/signup/', signup),
     path(f'{AUTH}/token/', token),
@@ -1,8 +1,9 @@
-from django_filters.rest_framework import DjangoFilterBackend
 from django.contrib.auth import get_user_model
 from django.contrib.auth.tokens import default_token_generator
 from django.core.mail import send_mail
-from django.db.models import Avg
+from django.db import transaction
+from django.db.models import Avg, Prefetch
+from django.http import Http404
 from django.shortcuts import get_object_or_404
 from rest_framework import viewsets, filters
 from rest_framework.filters import SearchFilter
@@ -13,7 +14,7 @@ from rest_framework_simplejwt.tokens import AccessToken
 
 from api_yamdb.settings import DEFAULT_FROM_EMAIL
 from reviews.models import Category, Comment, Genre, Review, Title
-from .filters import TitleFilter
+from .filters import LazyDjangoFilterBackend, TitleFilter
 from .mixins import CreateListDestroyModelMixin
 from .permissions import (
     ContentManagePermission,
@@ -47,8 +48,11 @@ class TitleViewSet(viewsets.ModelViewSet):
 
     queryset:
         queryset объектов Title, включающий все произведения.
-        В будущем планируется добавление аннотации 'rating' для
-        вычисления среднего рейтинга на основе отзывов.
+        Для действий чтения queryset дополняется аннотацией 'rating',
+        вычисляющей средний рейтинг произведения одним агрегирующим
+        запросом вместо отдельного запроса на каждый объект.
+        Жанры подтягиваются одним prefetch-запросом с проекцией только
+        тех колонок, которые отдает сериализатор.
 
     permission_classes:
         Права доступа определены классом IsAdminOrReadOnly.
@@ -64,13 +68,33 @@ class TitleViewSet(viewsets.ModelViewSet):
         определенным в TitleFilter (например, по категории, жанру, году)."
     """
     queryset = (Title.objects
-                .annotate(rating=Avg('reviews__score'))
-                .all()
+                .select_related('category')
+                .prefetch_related(Prefetch(
+                    'genre', queryset=Genre.objects.only('name', 'slug')))
                 )
     http_method_names = ['get', 'post', 'patch', 'delete', ]
     permission_classes = [IsAdminOrReadOnly, ]
-    filter_backends = [DjangoFilterBackend, ]
+    filter_backends = [LazyDjangoFilterBackend, ]
     filterset_class = TitleFilter
+    SERIALIZER_CLASSES = {
+        'list': TitleReadSerializer,
+        'retrieve': TitleReadSerializer,
+    }
+
+    def get_queryset(self):
+        """
+        Добавляет аннотацию 'rating' для действий, отдающих рейтинг.
+
+        Это действия чтения и partial_update: его ответ рендерится
+        через TitleReadSerializer и тоже содержит рейтинг. Действиям
+        create и destroy LEFT JOIN с агрегацией по таблице отзывов
+        не нужен: у нового произведения отзывов ещё нет, а ответ
+        destroy пуст.
+        """
+        queryset = super().get_queryset()
+        if self.action in ['list', 'retrieve', 'partial_update']:
+            queryset = queryset.annotate(rating=Avg('reviews__score'))
+        return queryset
 
     def get_serializer_class(self):
         """
@@ -80,10 +104,11 @@ class TitleViewSet(viewsets.ModelViewSet):
           предназначенный для чтения данных.
         - Для остальных действий (create, partial_update, delete) используется
           TitleWriteSerializer, предназначенный для записи данных.
+
+        Соответствие действий и сериализаторов задано таблицей
+        SERIALIZER_CLASSES, чтобы выбор стоил один поиск по словарю.
         """
-        if self.action in ['list', 'retrieve']:
-            return TitleReadSerializer
-        return TitleWriteSerializer
+        return self.SERIALIZER_CLASSES.get(self.action, TitleWriteSerializer)
 
 
 class GenreViewSet(CreateListDestroyModelMixin):
@@ -177,17 +202,20 @@ class CategoryViewSet(CreateListDestroyModelMixin):
 def signup(request):
     serializer = SignUpSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
-    user, _ = User.objects.get_or_create(
-        username=request.data['username'], email=request.data['email']
-    )
-    token = default_token_generator.make_token(user)
-    send_mail(
-        subject='Код для получения токена',
-        message=f'Ваш код: {token}',
-        from_email=DEFAULT_FROM_EMAIL,
-        recipient_list=[user.email],
-        fail_silently=False,
-    )
+    with transaction.atomic():
+        user, _ = User.objects.only(
+            'id', 'username', 'email', 'password', 'last_login'
+        ).get_or_create(
+            username=request.data['username'], email=request.data['email']
+        )
+        token = default_token_generator.make_token(user)
+        transaction.on_commit(lambda: send_mail(
+            subject='Код для получения токена',
+            message=f'Ваш код: {token}',
+            from_email=DEFAULT_FROM_EMAIL,
+            recipient_list=[user.email],
+            fail_silently=False,
+        ))
     return Response(data=serializer.data)
 
 
@@ -195,7 +223,10 @@ def signup(request):
 def token(request):
     serializer = TokenObtainSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
-    user = get_object_or_404(User, username=request.data['username'])
+    user = get_object_or_404(
+        User.objects.only('id', 'username', 'password', 'last_login', 'email'),
+        username=request.data['username']
+    )
     if not default_token_generator.check_token(
         user, request.data['confirmation_code']
     ):
@@ -214,10 +245,18 @@ class ReviewViewSet(viewsets.ModelViewSet):
     http_method_names = ['get', 'post', 'head', 'patch', 'delete']
 
     def get_title(self):
-        return get_object_or_404(Title, id=self.kwargs['title_id'])
+        if not hasattr(self, '_title'):
+            self._title = get_object_or_404(
+                Title, id=self.kwargs['title_id'])
+        return self._title
 
     def get_queryset(self):
-        return Review.objects.filter(title=self.get_title())
+        if (self.action == 'list'
+                and not Title.objects.filter(
+                    pk=self.kwargs['title_id']).exists()):
+            raise Http404
+        return Review.objects.with_context().filter(
+            title_id=self.kwargs['title_id'])
 
     def perform_create(self, serializer):
         serializer.save(
@@ -235,14 +274,24 @@ class CommentViewSet(viewsets.ModelViewSet):
     http_method_names = ['get', 'post', 'head', 'patch', 'delete']
 
     def get_review(self):
-        return get_object_or_404(
-            Review,
-            id=self.kwargs['review_id'],
-            title__id=self.kwargs['title_id']
-        )
+        if not hasattr(self, '_review'):
+            self._review = get_object_or_404(
+                Review,
+                id=self.kwargs['review_id'],
+                title__id=self.kwargs['title_id']
+            )
+        return self._review
 
     def get_queryset(self):
-        return Comment.objects.filter(review=self.get_review())
+        if (self.action == 'list'
+                and not Review.objects.filter(
+                    id=self.kwargs['review_id'],
+                    title_id=self.kwargs['title_id']).exists()):
+            raise Http404
+        return Comment.objects.with_context().filter(
+            review_id=self.kwargs['review_id'],
+            review__title_id=self.kwargs['title_id'],
+        )
 
     def perform_create(self, serializer):
         serializer.save(
@@ -257,7 +306,8 @@ class UserAdminViewSet(viewsets.ModelViewSet):
 
     Предоставляет операции CRUD за исключением PUT-запросов.
     """
-    queryset = User.objects.all()
+    queryset = User.objects.only(
+        'id', 'username', 'email', 'first_name', 'last_name', 'bio', 'role')
     serializer_class = UserSerializer
     permission_classes = (IsAdminPermission,)
     filter_backends = (filters.SearchFilter,)
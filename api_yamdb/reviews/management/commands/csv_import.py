@@ -4,11 +4,14 @@ import os
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
 
 from reviews.models import Category, Comment, Genre, Review, Title
 
 CSV_FILES_DIR = os.path.join(settings.BASE_DIR, 'static/data')
 
+BATCH_SIZE = 1000
+
 User = get_user_model()
 
 CSV_FILES_MAPPING = {
@@ -16,17 +19,18 @@ CSV_FILES_MAPPING = {
     Category: 'category.csv',
     Genre: 'genre.csv',
     Title: 'titles.csv',
+    Title.genre.through: 'genre_title.csv',
     Review: 'review.csv',
     Comment: 'comments.csv',
 }
 
-FOREIGN_KEY_FIELDS = {
-    'category': Category,
-    'title': Title,
-    'genre': Genre,
-    'author': User,
-    'review': Review,
-}
+FOREIGN_KEY_FIELDS = frozenset({
+    'category',
+    'title',
+    'genre',
+    'author',
+    'review',
+})
 
 
 class Command(BaseCommand):
@@ -39,13 +43,15 @@ class Command(BaseCommand):
     моделями Django и именами CSV файлов. Ожидает, что CSV файлы находятся
     в директории, заданной переменной `CSV_FILES_DIR`.
 
-    Для обработки внешних ключей используется словарь `FOREIGN_KEY_FIELDS`,
-    где ключи - это имена полей внешних ключей (без '_id'), а значения -
-    классы моделей, на которые ссылаются внешние ключи.
+    Для обработки внешних ключей используется множество `FOREIGN_KEY_FIELDS`
+    с именами полей внешних ключей (без '_id'). Значение из CSV записывается
+    напрямую в колонку `<поле>_id`, без запроса связанного объекта из базы.
 
-    Команда построчно читает CSV файлы, преобразует данные и создает
-    соответствующие записи в базе данных для каждой модели, указанной
-    в `CSV_FILES_MAPPING`.
+    Команда потоково читает CSV файлы и вставляет записи пачками через
+    `bulk_create` (размер пачки - `BATCH_SIZE`), а не по одному INSERT
+    на строку, для каждой модели, указанной в `CSV_FILES_MAPPING`.
+    В памяти одновременно находится не больше одной пачки, поэтому
+    размер файла не влияет на пиковое потребление памяти.
 
     Выводит сообщения об успехе импорта для каждого файла и общее сообщение
     о завершении импорта в стандартный вывод. В случае, если CSV файл
@@ -65,6 +71,7 @@ class Command(BaseCommand):
     requires_migrations_checks = True
 
     def handle(self, *args, **options):
+        success = self.style.SUCCESS
         for model, file_name in CSV_FILES_MAPPING.items():
             csv_file_path = os.path.join(CSV_FILES_DIR, file_name)
             if not os.path.exists(csv_file_path):
@@ -72,20 +79,26 @@ class Command(BaseCommand):
                     f'Файл {file_name} не найден в директории {CSV_FILES_DIR}'
                 )
 
-            with open(csv_file_path, 'r', encoding='utf-8') as file:
-                reader = csv.DictReader(file)
+            with open(csv_file_path, 'r', encoding='utf-8') as file, \
+                    transaction.atomic():
+                reader = csv.reader(file)
+                fields = []
+                for column in next(reader):
+                    data_key = column.replace('_id', '')
+                    if data_key in FOREIGN_KEY_FIELDS:
+                        fields.append(f'{data_key}_id')
+                    else:
+                        fields.append(column)
+                batch = []
                 for row in reader:
-                    data = {}
-                    for field_name, value in row.items():
-                        data_key = field_name.replace('_id', '')
-                        if data_key in FOREIGN_KEY_FIELDS:
-                            model_class = FOREIGN_KEY_FIELDS.get(data_key)
-                            data[data_key] = model_class.objects.get(id=value)
-                        else:
-                            data[field_name] = value
-                    model.objects.create(**data)
-            self.stdout.write(self.style.SUCCESS(
+                    batch.append(model(**dict(zip(fields, row))))
+                    if len(batch) >= BATCH_SIZE:
+                        model.objects.bulk_create(batch)
+                        batch = []
+                if batch:
+                    model.objects.bulk_create(batch)
+            self.stdout.write(success(
                 f'Данные из {file_name} успешно импортированы в '
                 f'{model.__name__}'
             ))
-        self.stdout.write(self.style.SUCCESS('Импорт завершен'))
+        self.stdout.write(success('Импорт завершен'))
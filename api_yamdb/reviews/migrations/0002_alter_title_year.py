@@ -0,0 +1,19 @@
+# Generated by Django 3.2 on 2026-08-27 09:00
+
+from django.db import migrations, models
+import reviews.validators
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='title',
+            name='year',
+            field=models.SmallIntegerField(db_index=True, help_text='Год создания произведения', validators=[reviews.validators.validate_year], verbose_name='Год создания'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 3.2 on 2026-08-27 09:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews', '0003_review_score_range'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='comment',
+            index=models.Index(fields=['review', 'pub_date'], name='reviews_com_review__eef424_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='review',
+            index=models.Index(fields=['title', 'pub_date'], name='reviews_rev_title_i_bce0da_idx'),
+        ),
+    ]
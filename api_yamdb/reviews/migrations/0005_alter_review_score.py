@@ -0,0 +1,18 @@
+# Generated by Django 3.2 on 2026-08-27 09:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews', '0004_auto_20260827_0910'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='review',
+            name='score',
+            field=models.PositiveSmallIntegerField(),
+        ),
+    ]
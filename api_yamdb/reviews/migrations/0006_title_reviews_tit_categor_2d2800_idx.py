@@ -0,0 +1,17 @@
+# Generated by Django 3.2 on 2026-08-27 09:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews', '0005_alter_review_score'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='title',
+            index=models.Index(fields=['category', 'year', 'name'], name='reviews_tit_categor_2d2800_idx'),
+        ),
+    ]
@@ -1,5 +1,4 @@
-from django.contrib.auth import get_user_model
-from django.core.validators import MinValueValidator, MaxValueValidator
+from django.conf import settings
 from django.db import models
 from api_yamdb.settings import (
     DEFAULT_NAME_LENGTH,
@@ -9,8 +8,6 @@ from api_yamdb.settings import (
 )
 from .validators import validate_year
 
-User = get_user_model()
-
 
 class Title(models.Model):
     """
@@ -53,7 +50,8 @@ class Title(models.Model):
     year = models.SmallIntegerField(
         verbose_name='Год создания',
         help_text='Год создания произведения',
-        validators=[validate_year]
+        validators=[validate_year],
+        db_index=True,
     )
     description = models.TextField(
         verbose_name='Описание',
@@ -79,9 +77,12 @@ class Title(models.Model):
         verbose_name = 'Произведение'
         verbose_name_plural = 'Произведения'
         ordering = ('name',)
+        indexes = [
+            models.Index(fields=['category', 'year', 'name']),
+        ]
 
     def __str__(self):
-        return f'{self.category} {self.name}'
+        return self.name
 
 
 class Genre(models.Model):
@@ -158,44 +159,72 @@ class Category(models.Model):
         return f'Категория {self.name}'
 
 
+class ReviewQuerySet(models.QuerySet):
+    """QuerySet отзывов с подготовленной выборкой для сериализатора."""
+
+    def with_context(self):
+        """
+        Присоединяет автора и оставляет только колонки, которые
+        читает ReviewSerializer, сокращая объем данных на строку.
+        """
+        return self.select_related('author').only(
+            'id', 'text', 'score', 'pub_date', 'title',
+            'author__username',
+        )
+
+
 class Review(models.Model):
     """
     Модель для представления отзывов на произведения.
     """
     text = models.TextField()
-    score = models.SmallIntegerField(
-        validators=[
-            MinValueValidator(
-                REVIEW_MIN_SCORE,
-                f"Оценка на может быть меньше {REVIEW_MIN_SCORE}"
-            ),
-            MaxValueValidator(
-                REVIEW_MAX_SCORE,
-                f"Оценка на может быть больше {REVIEW_MAX_SCORE}"
-            )
-        ]
-    )
+    score = models.PositiveSmallIntegerField()
     pub_date = models.DateTimeField(
         'Дата публикации', auto_now_add=True, db_index=True
     )
     author = models.ForeignKey(
-        User, on_delete=models.CASCADE, related_name='reviews'
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='reviews'
     )
     title = models.ForeignKey(
         Title, on_delete=models.CASCADE, related_name='reviews'
     )
 
+    objects = ReviewQuerySet.as_manager()
+
     class Meta:
         verbose_name = 'Отзыв'
         verbose_name_plural = 'Отзывы'
-        ordering = ('pub_date', 'title')
+        ordering = ('pub_date', 'id')
+        indexes = [
+            models.Index(fields=['title', 'pub_date']),
+        ]
         constraints = [
             models.UniqueConstraint(
                 fields=['author', 'title'], name='unique_review'),
+            models.CheckConstraint(
+                check=models.Q(
+                    score__gte=REVIEW_MIN_SCORE, score__lte=REVIEW_MAX_SCORE),
+                name='score_range'),
         ]
 
     def __str__(self):
-        return f"{self.id} отзыв на произведение {self.title.name}."
+        return f"Отзыв №{self.id} на произведение №{self.title_id}."
+
+
+class CommentQuerySet(models.QuerySet):
+    """QuerySet комментариев с подготовленной выборкой для сериализатора."""
+
+    def with_context(self):
+        """
+        Присоединяет автора и оставляет только колонки, которые
+        читает CommentSerializer, сокращая объем данных на строку.
+        """
+        return self.select_related('author').only(
+            'id', 'text', 'pub_date', 'review',
+            'author__username',
+        )
 
 
 class Comment(models.Model):
@@ -203,7 +232,9 @@ class Comment(models.Model):
     Модель для представления комментариев на отзывы пользователей.
     """
     author = models.ForeignKey(
-        User, on_delete=models.CASCADE, related_name='comments'
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='comments'
     )
     review = models.ForeignKey(
         Review, on_delete=models.CASCADE, related_name='comments'
@@ -213,10 +244,15 @@ class Comment(models.Model):
         'Дата публикации', auto_now_add=True, db_index=True
     )
 
+    objects = CommentQuerySet.as_manager()
+
     class Meta:
         verbose_name = 'Комментарий'
         verbose_name_plural = 'Комментарии'
-        ordering = ('pub_date', 'review')
+        ordering = ('pub_date', 'id')
+        indexes = [
+            models.Index(fields=['review', 'pub_date']),
+        ]
 
     def __str__(self):
-        return f"Комментарий №{self.id} к отзыву на {self.title.name}."
+        return f"Комментарий №{self.id} к отзыву №{self.review_id}."
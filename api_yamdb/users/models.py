@@ -1,12 +1,12 @@
 from django.db import models
 from django.contrib.auth.models import AbstractUser
-from django.contrib.auth.validators import UnicodeUsernameValidator
+from django.utils.functional import cached_property
 
-from .validators import validate_username
+from .validators import username_validator, validate_username
 
 
 MAX_LENGTH_USERNAME = 150
-MAX_LENGTH_ROLE = 100
+MAX_LENGTH_ROLE = 16
 
 
 class UserProfile(AbstractUser):
@@ -23,7 +23,7 @@ class UserProfile(AbstractUser):
         'Никнейм',
         max_length=MAX_LENGTH_USERNAME,
         unique=True,
-        validators=[UnicodeUsernameValidator(), validate_username]
+        validators=[username_validator, validate_username]
     )
 
     email = models.EmailField(
@@ -47,10 +47,12 @@ class UserProfile(AbstractUser):
         verbose_name = 'Пользователь'
         verbose_name_plural = 'Пользователи'
 
+    @cached_property
     def is_moderator(self):
         """Проверяет, является ли пользователь модератором."""
         return self.role == self.UsersRole.MODERATOR
 
+    @cached_property
     def is_admin(self):
         """Проверяет, является ли пользователь администратором."""
         return self.role == self.UsersRole.ADMIN or self.is_superuser
@@ -1,12 +1,16 @@
+from django.contrib.auth.validators import UnicodeUsernameValidator
 from django.core.exceptions import ValidationError
 
 from api_yamdb.settings import FORBIDDEN_NICKNAMES
 
 
+username_validator = UnicodeUsernameValidator()
+
+
 def validate_username(value):
     """
     Метод проверяющий поле на соответствие условию.
     """
-    if value.lower() in FORBIDDEN_NICKNAMES:
+    if value.casefold() in FORBIDDEN_NICKNAMES:
         raise ValidationError(
             f'Использование имени "{value}" под запретом.')